@@ -9,8 +9,10 @@ YAML front matter with Obsidian-compatible wiki-links.
 import re
 import sys
 import calendar
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List, NamedTuple
+from typing import List, Optional, Tuple
 
 import click
 from rich.console import Console
@@ -24,8 +26,115 @@ from rich.text import Text
 console = Console()
 error_console = Console(stderr=True)
 
-
-class MarkdownMetadata(NamedTuple):
+# Pre-compiled regex patterns
+_YEAR_RE = re.compile(r'\b(19|20)\d{2}\b')
+_YEAR_ONLY_RE = re.compile(r'\s*(19|20)\d{2}\s*')
+_DATE_LAYOUT_RE = re.compile(
+    # Month range: "March-April 2023", "Jan/Feb 2020"
+    r'(?P<range>(?P<range_start>[A-Za-z]+)\s*[-/]\s*(?P<range_end>[A-Za-z]+)\s*(?:\d{4})?)'
+    # "Month Year"
+    r'|(?P<month_year>(?P<my_month>[A-Za-z]+)\s*,?\s*\d{4})'
+    # "Month Day, Year"
+    r'|(?P<month_day_year>(?P<mdy_month>[A-Za-z]+)\s+\d{1,2},?\s*\d{4})'
+    # "Day Month Year"
+    r'|(?P<day_month_year>\d{1,2}\s+(?P<dmy_month>[A-Za-z]+)\s*,?\s*\d{4})'
+    # Numeric: MM/YYYY, MM-YYYY
+    r'|(?P<numeric_month_year>(?P<nmy_month>\d{1,2})[/-]\d{4})'
+    # Numeric: YYYY/MM, YYYY-MM
+    r'|(?P<numeric_year_month>\d{4}[/-](?P<nym_month>\d{1,2}))',
+    re.IGNORECASE
+)
+
+# Header fields; values are captured in lookaheads so a match only consumes
+# its marker and never hides a following field
+_HEADER_FIELD_RE = re.compile(
+    r'^#(?=\s+(?P<title>.+?)(?:\s*$|\s*\n))'
+    r'|\*\*Author\(s\):\*\*(?=\s*(?P<authors>.+?)(?:\s*$|\s*\n))'
+    r'|\*\*Publication:\*\*(?=\s*(?P<book>.+?)(?:\s*$|\s*\n))'
+    r'|\*\*Date:\*\*(?=\s*(?P<date>.+?)(?:\s*$|\s*\n))',
+    re.MULTILINE
+)
+_HEADER_FIELD_COUNT = 4
+
+# Characters read from the start of a file when the full body isn't needed
+HEADER_READ_SIZE = 8192
+_AUTHOR_SPLIT_RE = re.compile(r'[,;&]|\s+and\s+')
+
+_FRONTMATTER_RE = re.compile(r'^---\n(.*?)\n---', re.DOTALL)
+_FRONTMATTER_BLOCK_RE = re.compile(r'^(---\n.*?\n---)', re.DOTALL)
+_FM_TITLE_RE = re.compile(r'^Title:\s*"(.+?)"', re.MULTILINE)
+_FM_BOOK_RE = re.compile(r'^Book:\s*(.+?)$', re.MULTILINE)
+_FM_BOOK_LINK_RE = re.compile(r'^Book: "\[\[(.*?)\]\]"', re.MULTILINE)
+_FM_AUTHORS_BLOCK_RE = re.compile(r'^Authors:[ \t]*\n((?:[ \t]+-[ \t]+.*(?:\n|$))*)', re.MULTILINE)
+_FM_AUTHOR_LINK_RE = re.compile(r'^[ \t]+-[ \t]+"\[\[(.*)\]\]"[ \t]*$', re.MULTILINE)
+_FM_DATE_RE = re.compile(r'^Date:\s*"(.+?)"', re.MULTILINE)
+# Season words must not run on into another word ("Springer"), but may be
+# glued to a quarter ("FallQ1"); quarters match anywhere
+_SEASON_RE = re.compile(r'(?:spring|summer|fall|autumn|winter)(?![a-pr-z]|q(?![1-4]))|q[1-4]')
+
+# Strings that indicate a date is intentionally absent
+_NON_DATE_SET = frozenset(['not specified', 'unknown', 'n/a', 'none', 'tbd', 'undated'])
+
+# Month name mappings (handles abbreviations)
+_MONTH_NAMES = {
+    'jan': 'January', 'january': 'January',
+    'feb': 'February', 'february': 'February',
+    'mar': 'March', 'march': 'March',
+    'apr': 'April', 'april': 'April',
+    'may': 'May',
+    'jun': 'June', 'june': 'June',
+    'jul': 'July', 'july': 'July',
+    'aug': 'August', 'august': 'August',
+    'sep': 'September', 'sept': 'September', 'september': 'September',
+    'oct': 'October', 'october': 'October',
+    'nov': 'November', 'november': 'November',
+    'dec': 'December', 'december': 'December'
+}
+
+# Season/quarter mappings
+_SEASON_MAP = {
+    'spring': 'Spring', 'summer': 'Summer',
+    'fall': 'Fall', 'autumn': 'Fall', 'winter': 'Winter',
+    'q1': 'Q1', 'q2': 'Q2', 'q3': 'Q3', 'q4': 'Q4'
+}
+
+# Order in which matched date layouts are preferred by normalize_date
+_DATE_LAYOUT_PRIORITY = (
+    'range',
+    'season',
+    'month_year',
+    'month_day_year',
+    'day_month_year',
+    'numeric_month_year',
+    'numeric_year_month',
+)
+
+
+# Translation table mapping common non-ASCII punctuation to ASCII equivalents
+_ASCII_TRANSLATION = str.maketrans({
+    # Dashes
+    '\u2013': '-',  # en-dash
+    '\u2014': '-',  # em-dash
+    '\u2010': '-',  # hyphen
+    '\u2011': '-',  # non-breaking hyphen
+    '\u2012': '-',  # figure dash
+    '\u2015': '-',  # horizontal bar
+    '\u00ad': None,  # soft hyphen (remove)
+    # Spaces
+    '\u00a0': ' ',  # non-breaking space
+    '\u2002': ' ',  # en space
+    '\u2003': ' ',  # em space
+    '\u2009': ' ',  # thin space
+    '\u200a': ' ',  # hair space
+    '\u200b': None,  # zero-width space (remove)
+    '\u202f': ' ',  # narrow no-break space
+    '\u205f': ' ',  # medium mathematical space
+    '\u3000': ' ',  # ideographic space
+})
+
+
+@dataclass(slots=True, frozen=True)
+class MarkdownMetadata:
     """Container for extracted markdown metadata."""
     title: str
     authors: List[str]
@@ -33,38 +142,41 @@ class MarkdownMetadata(NamedTuple):
     publication_date: str
 
 
+@lru_cache(maxsize=1024)
 def clean_to_ascii(text: str) -> str:
     """
     Remove non-ASCII characters from a string, but first replace
     common non-ASCII punctuation with ASCII equivalents.
     """
-    # Replace common non-ASCII characters with ASCII equivalents
-    replacements = {
-        # Dashes
-        '\u2013': '-',  # en-dash
-        '\u2014': '-',  # em-dash
-        '\u2010': '-',  # hyphen
-        '\u2011': '-',  # non-breaking hyphen
-        '\u2012': '-',  # figure dash
-        '\u2015': '-',  # horizontal bar
-        '\u00ad': '',   # soft hyphen (remove)
-        # Spaces
-        '\u00a0': ' ',  # non-breaking space
-        '\u2002': ' ',  # en space
-        '\u2003': ' ',  # em space
-        '\u2009': ' ',  # thin space
-        '\u200a': ' ',  # hair space
-        '\u200b': '',   # zero-width space (remove)
-        '\u202f': ' ',  # narrow no-break space
-        '\u205f': ' ',  # medium mathematical space
-        '\u3000': ' ',  # ideographic space
-    }
-    for char, replacement in replacements.items():
-        text = text.replace(char, replacement)
-
-    return ''.join(char for char in text if ord(char) < 128)
+    # Replace common non-ASCII characters, then drop anything left over
+    return text.translate(_ASCII_TRANSLATION).encode('ascii', 'ignore').decode('ascii')
+
+
+def _month_from_date_match(match: re.Match) -> Optional[str]:
+    """
+    Resolve a _DATE_LAYOUT_RE match to a month name (or month range).
+    Returns None if the matched words or numbers are not valid months.
+    """
+    kind = match.lastgroup
+
+    if kind == 'range':
+        month1 = _MONTH_NAMES.get(match.group('range_start').lower())
+        month2 = _MONTH_NAMES.get(match.group('range_end').lower())
+        if month1 and month2:
+            return f"{month1}-{month2}"
+        return None
+
+    if kind in ('numeric_month_year', 'numeric_year_month'):
+        month_num = int(match.group('nmy_month') or match.group('nym_month'))
+        if 1 <= month_num <= 12:
+            return calendar.month_name[month_num]
+        return None
 
+    month_raw = match.group('my_month') or match.group('mdy_month') or match.group('dmy_month')
+    return _MONTH_NAMES.get(month_raw.lower())
 
+
+@lru_cache(maxsize=4096)
 def normalize_date(date_str: str) -> str:
     """
     Attempts to normalize a date string into a consistent format.
@@ -81,97 +193,50 @@ def normalize_date(date_str: str) -> str:
     if not date_str:
         return ""
 
+    # Non-date indicators are plain ASCII, so check them before cleaning
+    stripped = date_str.strip()
+    if stripped.lower() in _NON_DATE_SET:
+        return stripped
+
     # Clean and normalize whitespace
-    cleaned = clean_to_ascii(date_str).strip()
-    cleaned = re.sub(r'\s+', ' ', cleaned)
+    cleaned = ' '.join(clean_to_ascii(date_str).split())
 
     # Check for non-date indicators
-    non_date_patterns = ['not specified', 'unknown', 'n/a', 'none', 'tbd', 'undated']
-    if cleaned.lower() in non_date_patterns or not cleaned:
+    cleaned_lower = cleaned.lower()
+    if cleaned_lower in _NON_DATE_SET or not cleaned:
         return cleaned
 
-    # Month name mappings (handles abbreviations)
-    month_names = {
-        'jan': 'January', 'january': 'January',
-        'feb': 'February', 'february': 'February',
-        'mar': 'March', 'march': 'March',
-        'apr': 'April', 'april': 'April',
-        'may': 'May',
-        'jun': 'June', 'june': 'June',
-        'jul': 'July', 'july': 'July',
-        'aug': 'August', 'august': 'August',
-        'sep': 'September', 'sept': 'September', 'september': 'September',
-        'oct': 'October', 'october': 'October',
-        'nov': 'November', 'november': 'November',
-        'dec': 'December', 'december': 'December'
-    }
-
-    # Season/quarter mappings
-    season_map = {
-        'spring': 'Spring', 'summer': 'Summer',
-        'fall': 'Fall', 'autumn': 'Fall', 'winter': 'Winter',
-        'q1': 'Q1', 'q2': 'Q2', 'q3': 'Q3', 'q4': 'Q4'
-    }
-
     # Try to extract year (4 digits)
-    year_match = re.search(r'\b(19|20)\d{2}\b', cleaned)
+    year_match = _YEAR_RE.search(cleaned)
     year = year_match.group(0) if year_match else None
 
     if not year:
         return cleaned
 
-    # Check for month range (e.g., "March-April 2023", "Jan/Feb 2020")
-    range_pattern = r'([A-Za-z]+)\s*[-/]\s*([A-Za-z]+)\s*(\d{4})?'
-    range_match = re.search(range_pattern, cleaned, re.IGNORECASE)
-    if range_match:
-        month1_raw = range_match.group(1).lower()
-        month2_raw = range_match.group(2).lower()
-        if month1_raw in month_names and month2_raw in month_names:
-            month1 = month_names[month1_raw]
-            month2 = month_names[month2_raw]
-            return f"{month1}-{month2} {year}"
-
-    # Check for season/quarter + year
-    for season_key, season_name in season_map.items():
-        if season_key in cleaned.lower():
-            return f"{season_name} {year}"
-
-    # Check for "Month Year" format
-    month_year_pattern = r'([A-Za-z]+)\s*,?\s*(\d{4})'
-    month_year_match = re.search(month_year_pattern, cleaned)
-    if month_year_match:
-        month_raw = month_year_match.group(1).lower()
-        if month_raw in month_names:
-            return f"{month_names[month_raw]} {year}"
-
-    # Check for "Month Day, Year" or "Day Month Year" format
-    full_date_patterns = [
-        r'([A-Za-z]+)\s+(\d{1,2}),?\s*(\d{4})',
-        r'(\d{1,2})\s+([A-Za-z]+)\s*,?\s*(\d{4})',
-    ]
-    for pattern in full_date_patterns:
-        match = re.search(pattern, cleaned)
-        if match:
-            groups = match.groups()
-            for g in groups:
-                if g.lower() in month_names:
-                    return f"{month_names[g.lower()]} {year}"
-
-    # Check for numeric formats: MM/YYYY, YYYY-MM, MM-YYYY
-    numeric_patterns = [
-        (r'(\d{1,2})[/-](\d{4})', 1),
-        (r'(\d{4})[/-](\d{1,2})', 2),
-    ]
-    for pattern, month_group in numeric_patterns:
-        match = re.search(pattern, cleaned)
-        if match:
-            month_num = int(match.group(month_group))
-            if 1 <= month_num <= 12:
-                month_name = calendar.month_name[month_num]
-                return f"{month_name} {year}"
+    # Scan once for every month-based layout, keeping the first match of
+    # each kind. Resuming one character after each match start visits every
+    # position a separate search per layout would, so a match of one layout
+    # ("Published / March 2023") cannot hide the first match of another.
+    found = {}
+    pos = 0
+    while match := _DATE_LAYOUT_RE.search(cleaned_lower, pos):
+        found.setdefault(match.lastgroup, _month_from_date_match(match))
+        pos = match.start() + 1
+
+    # Check for season/quarter + year, preferring seasons in _SEASON_MAP order
+    seasons = set(_SEASON_RE.findall(cleaned_lower))
+    for season_key, season_name in _SEASON_MAP.items():
+        if season_key in seasons:
+            found['season'] = season_name
+            break
+
+    # Month ranges win over seasons, which win over single-month layouts
+    for kind in _DATE_LAYOUT_PRIORITY:
+        if found.get(kind):
+            return f"{found[kind]} {year}"
 
     # If only year found, return just the year
-    if re.fullmatch(r'\s*(19|20)\d{2}\s*', cleaned):
+    if _YEAR_ONLY_RE.fullmatch(cleaned):
         return year
 
     return cleaned
@@ -191,23 +256,27 @@ def extract_metadata_from_markdown(content: str) -> MarkdownMetadata:
         **Publication:** Book or Publication Name
         **Date:** Date String
     """
-    # Extract title from first H1 heading (# Title)
-    title_match = re.search(r'^#\s+(.+?)(?:\s*$|\s*\n)', content, re.MULTILINE)
-    title = title_match.group(1).strip() if title_match else ""
-
-    # Extract authors from **Author(s):** line
-    authors_match = re.search(r'\*\*Author\(s\):\*\*\s*(.+?)(?:\s*$|\s*\n)', content, re.MULTILINE)
-    authors_str = authors_match.group(1).strip() if authors_match else ""
+    # Find the first occurrence of each field in a single pass, stopping
+    # as soon as all of them have been seen
+    fields = {}
+    for match in _HEADER_FIELD_RE.finditer(content):
+        fields.setdefault(match.lastgroup, match.group(match.lastgroup))
+        if len(fields) == _HEADER_FIELD_COUNT:
+            break
+
+    # Title from first H1 heading (# Title)
+    title = fields.get('title', '').strip()
+
+    # Authors from **Author(s):** line
+    authors_str = fields.get('authors', '').strip()
     # Split authors by comma, semicolon, ampersand, or " and " and clean up
-    authors = [a.strip() for a in re.split(r'[,;&]|\s+and\s+', authors_str) if a.strip()]
+    authors = list(filter(None, map(str.strip, _AUTHOR_SPLIT_RE.split(authors_str))))
 
-    # Extract publication/book from **Publication:** line
-    pub_match = re.search(r'\*\*Publication:\*\*\s*(.+?)(?:\s*$|\s*\n)', content, re.MULTILINE)
-    book = pub_match.group(1).strip() if pub_match else ""
+    # Publication/book from **Publication:** line
+    book = fields.get('book', '').strip()
 
-    # Extract date from **Date:** line, clean to ASCII, and normalize
-    date_match = re.search(r'\*\*Date:\*\*\s*(.+?)(?:\s*$|\s*\n)', content, re.MULTILINE)
-    raw_date = date_match.group(1).strip() if date_match else ""
+    # Date from **Date:** line, cleaned to ASCII and normalized
+    raw_date = fields.get('date', '').strip()
     publication_date = normalize_date(raw_date)
 
     return MarkdownMetadata(
@@ -218,42 +287,60 @@ def extract_metadata_from_markdown(content: str) -> MarkdownMetadata:
     )
 
 
+def read_markdown_head(file_path: Path, size: int = HEADER_READ_SIZE) -> Tuple[str, bool]:
+    """
+    Reads the start of a markdown file, trimmed to the last complete line.
+
+    Returns (text, complete) where complete is True if the whole file was read.
+    """
+    with open(file_path, encoding="utf-8") as f:
+        text = f.read(size)
+        if not f.read(1):
+            return text, True
+    return text[:text.rfind('\n') + 1], False
+
+
+def head_contains_metadata(head: str) -> bool:
+    """
+    Checks whether a partial read of a file is enough to extract metadata
+    and front matter: all header fields are present and any front matter
+    block is closed.
+    """
+    if head.startswith('---\n') and not _FRONTMATTER_RE.match(head):
+        return False
+    fields = {match.lastgroup for match in _HEADER_FIELD_RE.finditer(head)}
+    return len(fields) == _HEADER_FIELD_COUNT
+
+
 def add_title_to_frontmatter(content: str, metadata: MarkdownMetadata) -> str:
     """
     Adds metadata fields to the YAML front matter of markdown content.
     Preserves any existing front matter content.
     """
-    # Regex to match YAML front matter between --- delimiters at the start
-    frontmatter_pattern = re.compile(r'^---\n(.*?)\n---', re.DOTALL)
-    match = frontmatter_pattern.match(content)
+    # Match YAML front matter between --- delimiters at the start
+    match = _FRONTMATTER_RE.match(content)
 
-    # Build the new front matter fields
+    # Build the new front matter piece by piece and join once at the end
     # Format authors as Obsidian wiki-links
-    authors_yaml = "\n".join(f'  - "[[{author}]]"' for author in metadata.authors)
-
-    new_fields = f'''Title: "{metadata.title}"
-Authors:
-{authors_yaml}
-Book: "[[{metadata.book}]]"
-Date: "{metadata.publication_date}"'''
+    parts = ['---\nTitle: "', metadata.title, '"\nAuthors:\n']
+    parts.extend(f'  - "[[{author}]]"\n' for author in metadata.authors)
+    parts.append(f'Book: "[[{metadata.book}]]"\nDate: "{metadata.publication_date}"\n')
 
     if match:
-        # Get existing front matter content
-        existing_yaml = match.group(1).strip()
-
-        # Combine new fields with existing content
-        combined_yaml = f"{new_fields}\n{existing_yaml}"
-
-        # Rebuild the content with updated front matter
-        new_content = f"---\n{combined_yaml}\n---{content[match.end():]}"
-        return new_content
+        # Keep existing front matter content after the new fields
+        parts.append(match.group(1).strip())
+        parts.append('\n---')
+        parts.append(content[match.end():])
     else:
         # No front matter found, create new one
-        new_frontmatter = f"---\n{new_fields}\n---\n"
-        return new_frontmatter + content
+        parts.append('---\n')
+        parts.append(content)
+
+    return "".join(parts)
 
 
-class ValidationResult(NamedTuple):
+@dataclass(slots=True, frozen=True)
+class ValidationResult:
     """Result of front matter validation."""
     is_valid: bool
     errors: List[str]
@@ -275,8 +362,7 @@ def validate_frontmatter(content: str, metadata: MarkdownMetadata) -> Validation
     warnings = []
 
     # Check for front matter delimiters
-    frontmatter_pattern = re.compile(r'^---\n(.*?)\n---', re.DOTALL)
-    match = frontmatter_pattern.match(content)
+    match = _FRONTMATTER_RE.match(content)
 
     if not match:
         errors.append("Front matter delimiters (---) not found at start of file")
@@ -285,32 +371,34 @@ def validate_frontmatter(content: str, metadata: MarkdownMetadata) -> Validation
     frontmatter = match.group(1)
 
     # Check Title
-    title_match = re.search(r'^Title:\s*"(.+?)"', frontmatter, re.MULTILINE)
+    title_match = _FM_TITLE_RE.search(frontmatter)
     if not title_match:
         errors.append("Title field not found in front matter")
     elif title_match.group(1) != metadata.title:
         errors.append(f"Title mismatch: expected '{metadata.title}', found '{title_match.group(1)}'")
 
     # Check Authors
-    if 'Authors:' not in frontmatter:
+    authors_match = _FM_AUTHORS_BLOCK_RE.search(frontmatter)
+    if not authors_match:
         errors.append("Authors field not found in front matter")
     else:
+        found_authors = set(_FM_AUTHOR_LINK_RE.findall(authors_match.group(1)))
         for author in metadata.authors:
-            expected_author = f'"[[{author}]]"'
-            if expected_author not in frontmatter:
+            if author not in found_authors:
+                expected_author = f'"[[{author}]]"'
                 errors.append(f"Author '{author}' not found in expected format {expected_author}")
 
     # Check Book
-    expected_book = f'Book: "[[{metadata.book}]]"'
-    if expected_book not in frontmatter:
-        book_match = re.search(r'^Book:\s*(.+?)$', frontmatter, re.MULTILINE)
-        if not book_match:
+    book_link_match = _FM_BOOK_LINK_RE.search(frontmatter)
+    if not book_link_match or book_link_match.group(1) != metadata.book:
+        expected_book = f'Book: "[[{metadata.book}]]"'
+        if not _FM_BOOK_RE.search(frontmatter):
             errors.append("Book field not found in front matter")
         else:
             errors.append(f"Book field format incorrect: expected '{expected_book}'")
 
     # Check Date
-    date_match = re.search(r'^Date:\s*"(.+?)"', frontmatter, re.MULTILINE)
+    date_match = _FM_DATE_RE.search(frontmatter)
     if not date_match:
         errors.append("Date field not found in front matter")
     elif date_match.group(1) != metadata.publication_date:
@@ -346,8 +434,7 @@ def display_metadata_table(metadata: MarkdownMetadata) -> None:
 
 def display_frontmatter_preview(content: str) -> None:
     """Display a preview of the front matter."""
-    frontmatter_pattern = re.compile(r'^(---\n.*?\n---)', re.DOTALL)
-    match = frontmatter_pattern.match(content)
+    match = _FRONTMATTER_BLOCK_RE.match(content)
 
     if match:
         frontmatter = match.group(1)
@@ -380,7 +467,10 @@ def display_validation_result(result: ValidationResult) -> None:
 @click.option('--dry-run', '-n', is_flag=True, help="Preview changes without writing to file")
 @click.option('--verbose', '-v', is_flag=True, help="Show detailed output")
 @click.option('--quiet', '-q', is_flag=True, help="Suppress output except errors")
-def main(filename: str, output_dir: str, dry_run: bool, verbose: bool, quiet: bool) -> None:
+@click.option('--no-validate', is_flag=True,
+              help="Skip validating generated front matter before writing (ignored with -n and -v)")
+def main(filename: str, output_dir: str, dry_run: bool, verbose: bool, quiet: bool,
+         no_validate: bool) -> None:
     """
     Obsidian Front Matter Utility
 
@@ -392,6 +482,7 @@ def main(filename: str, output_dir: str, dry_run: bool, verbose: bool, quiet: bo
         obsidian-frontmatter -o <output_dir> <filename>
         obsidian-frontmatter -o <output_dir> -n <filename>  # dry run
         obsidian-frontmatter -o <output_dir> -v <filename>  # verbose
+        obsidian-frontmatter -o <output_dir> --no-validate <filename>
 
     \b
     EXPECTED MARKDOWN FORMAT:
@@ -447,9 +538,16 @@ def main(filename: str, output_dir: str, dry_run: bool, verbose: bool, quiet: bo
     if not quiet:
         console.print(f"[bold]Processing:[/bold] {file_path.name}")
 
-    # Read the file
+    # Read the file. A dry run only inspects the header and front matter,
+    # so the full file is read only when writing or if the head is not enough.
     try:
-        content = file_path.read_text(encoding="utf-8")
+        content = None
+        if dry_run:
+            head, complete = read_markdown_head(file_path)
+            if complete or head_contains_metadata(head):
+                content = head
+        if content is None:
+            content = file_path.read_text(encoding="utf-8")
     except Exception as e:
         error_console.print(f"[bold red]Error reading file:[/bold red] {e}")
         sys.exit(1)
@@ -464,16 +562,18 @@ def main(filename: str, output_dir: str, dry_run: bool, verbose: bool, quiet: bo
     # Add front matter
     modified_content = add_title_to_frontmatter(content, metadata)
 
-    # Validate the result
-    validation = validate_frontmatter(modified_content, metadata)
+    # Validate the result. Bulk runs can opt out with --no-validate, but the
+    # check always runs when the user is inspecting the output.
+    if not no_validate or verbose or dry_run:
+        validation = validate_frontmatter(modified_content, metadata)
 
-    if verbose or not validation.is_valid:
-        display_validation_result(validation)
-        console.print()
+        if verbose or not validation.is_valid:
+            display_validation_result(validation)
+            console.print()
 
-    if not validation.is_valid:
-        error_console.print("[bold red]Aborting due to validation errors.[/bold red]")
-        sys.exit(1)
+        if not validation.is_valid:
+            error_console.print("[bold red]Aborting due to validation errors.[/bold red]")
+            sys.exit(1)
 
     # Show preview
     if verbose or dry_run:
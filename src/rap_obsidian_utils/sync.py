@@ -6,26 +6,59 @@ A CLI tool to synchronize markdown files between directories,
 copying only files that have changed.
 """
 
+import errno
 import hashlib
+import json
+import mmap
+import os
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from enum import Enum, auto
 from pathlib import Path
-from typing import List, NamedTuple, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import click
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
+try:
+    from blake3 import blake3
+except ImportError:  # Optional: falls back to SHA-256
+    blake3 = None
+
+# blake3 releases before 0.4.0 lack update_mmap(); fall back to SHA-256 for those too
+if blake3 is not None and not (hasattr(blake3, "AUTO") and hasattr(blake3, "update_mmap")):
+    blake3 = None
+
 
 # Initialize Rich console
 console = Console()
 error_console = Console(stderr=True)
 
 # Constants
-CHUNK_SIZE = 8192  # 8KB chunks for hashing
+MMAP_THRESHOLD = 1024 * 1024  # Memory-map files larger than 1MB for hashing
 MTIME_TOLERANCE = 1.0  # 1 second tolerance for mtime comparison
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)  # Threads for I/O-bound work
+COPY_BLOCK_SIZE = 1024 * 1024 * 1024  # Max bytes per kernel copy call
+MANIFEST_FILENAME = ".sync-manifest.json"  # Hash cache kept in the destination
+MANIFEST_VERSION = 1
+HASH_ALGORITHM = "blake3" if blake3 is not None else "sha256"
+
+# Errors meaning a kernel copy method isn't supported for this pair of files
+_COPY_FALLBACK_ERRNOS = frozenset({
+    errno.EXDEV, errno.ENOSYS, errno.EOPNOTSUPP, errno.EINVAL, errno.EBADF, errno.ENOTSOCK,
+})
+
+# Kernel copy syscalls available on this platform, in order of preference
+_KERNEL_COPY_METHODS = tuple(
+    name for name in ("copy_file_range", "sendfile") if hasattr(os, name)
+)
+
+# Cached hashes per relative path: {"source": [mtime_ns, ctime_ns, size, hash], "dest": [...]}
+Manifest = Dict[str, Dict[str, list]]
 
 
 class SyncReason(Enum):
@@ -35,7 +68,8 @@ class SyncReason(Enum):
     CONTENT_CHANGED = auto()
 
 
-class SyncCandidate(NamedTuple):
+@dataclass(slots=True, frozen=True)
+class SyncCandidate:
     """A file that should be synced."""
     source_path: Path
     dest_path: Path
@@ -43,7 +77,8 @@ class SyncCandidate(NamedTuple):
     reason: SyncReason
 
 
-class SyncResult(NamedTuple):
+@dataclass(slots=True, frozen=True)
+class SyncResult:
     """Result of a sync operation."""
     synced_files: List[SyncCandidate]
     skipped_files: List[Path]
@@ -52,39 +87,142 @@ class SyncResult(NamedTuple):
 
 def compute_file_hash(file_path: Path) -> str:
     """
-    Compute SHA-256 hash of a file.
+    Compute a content hash of a file using HASH_ALGORITHM.
 
-    Uses chunked reading for memory efficiency with large files.
+    With the optional blake3 package installed, the file is memory-mapped
+    and hashed with BLAKE3 (SIMD, multithreaded for large files). Otherwise
+    SHA-256 is used: large files are memory-mapped and hashed in a single
+    update, smaller files are read with hashlib.file_digest().
     """
-    sha256 = hashlib.sha256()
+    if blake3 is not None:
+        hasher = blake3(max_threads=blake3.AUTO)
+        hasher.update_mmap(file_path)
+        return hasher.hexdigest()
+
     with open(file_path, 'rb') as f:
-        while chunk := f.read(CHUNK_SIZE):
-            sha256.update(chunk)
-    return sha256.hexdigest()
+        if os.fstat(f.fileno()).st_size > MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return hashlib.sha256(mapped).hexdigest()
+        return hashlib.file_digest(f, 'sha256').hexdigest()
+
+
+def load_manifest(dest_dir: Path) -> Manifest:
+    """
+    Load cached file hashes from the destination's manifest.
+
+    Returns an empty manifest if the file is missing, unreadable, from an
+    incompatible version, or recorded with a different hash algorithm.
+    """
+    try:
+        data = json.loads((dest_dir / MANIFEST_FILENAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+        return {}
+    if data.get("algorithm") != HASH_ALGORITHM:
+        return {}
+    files = data.get("files")
+    if not isinstance(files, dict):
+        return {}
+
+    # Drop malformed entries so stale cache data can never abort a sync
+    manifest = {}
+    for relative_key, entry in files.items():
+        if not isinstance(entry, dict):
+            continue
+        manifest[relative_key] = {
+            role: cached
+            for role, cached in entry.items()
+            if isinstance(cached, list) and len(cached) == 4 and isinstance(cached[-1], str)
+        }
+    return manifest
+
 
+def save_manifest(dest_dir: Path, manifest: Manifest) -> None:
+    """
+    Write cached file hashes to the destination's manifest.
 
-def should_sync_file(source: Path, dest: Path) -> Tuple[bool, Optional[SyncReason]]:
+    Writes to a temporary file first so an interrupted run never leaves
+    a truncated manifest behind.
+    """
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = dest_dir / MANIFEST_FILENAME
+    temp_path = manifest_path.with_name(manifest_path.name + ".tmp")
+    temp_path.write_text(
+        json.dumps({
+            "version": MANIFEST_VERSION,
+            "algorithm": HASH_ALGORITHM,
+            "files": manifest,
+        }),
+        encoding="utf-8"
+    )
+    os.replace(temp_path, manifest_path)
+
+
+def _stat_key(file_stat: os.stat_result) -> list:
+    """Fields that must be unchanged for a cached hash to be trusted."""
+    return [file_stat.st_mtime_ns, file_stat.st_ctime_ns, file_stat.st_size]
+
+
+def _cached_file_hash(
+    file_path: Path,
+    file_stat: os.stat_result,
+    cache_entry: Optional[Dict[str, list]],
+    role: str
+) -> str:
+    """
+    Return the hash of a file, reusing cache_entry[role] if the file is
+    unchanged since it was recorded. Newly computed hashes are stored back.
+    """
+    if cache_entry is None:
+        return compute_file_hash(file_path)
+
+    key = _stat_key(file_stat)
+    cached = cache_entry.get(role)
+    if cached and cached[:-1] == key:
+        return cached[-1]
+
+    file_hash = compute_file_hash(file_path)
+    cache_entry[role] = key + [file_hash]
+    return file_hash
+
+
+def should_sync_file(
+    source: Path,
+    dest: Path,
+    cache_entry: Optional[Dict[str, list]] = None
+) -> Tuple[bool, Optional[SyncReason]]:
     """
     Determine if a file should be synced based on mtime and hash.
 
+    If cache_entry is given, hashes recorded in it by a previous run are
+    reused for files whose mtime, ctime and size are unchanged.
+
     Returns:
         Tuple of (should_sync, reason) where reason is None if should_sync is False.
     """
     # If destination doesn't exist, definitely sync
-    if not dest.exists():
+    try:
+        dest_stat = dest.stat()
+    except (FileNotFoundError, NotADirectoryError):
         return (True, SyncReason.NEW_FILE)
 
-    source_mtime = source.stat().st_mtime
-    dest_mtime = dest.stat().st_mtime
+    source_stat = source.stat()
+    source_mtime = source_stat.st_mtime
+    dest_mtime = dest_stat.st_mtime
 
     # If source is newer, sync
     if source_mtime > dest_mtime + MTIME_TOLERANCE:
         return (True, SyncReason.MTIME_NEWER)
 
-    # If mtimes are approximately equal, compare hashes
+    # If mtimes are approximately equal, compare sizes, then hashes
     if abs(source_mtime - dest_mtime) <= MTIME_TOLERANCE:
-        source_hash = compute_file_hash(source)
-        dest_hash = compute_file_hash(dest)
+        if source_stat.st_size != dest_stat.st_size:
+            return (True, SyncReason.CONTENT_CHANGED)
+
+        source_hash = _cached_file_hash(source, source_stat, cache_entry, "source")
+        dest_hash = _cached_file_hash(dest, dest_stat, cache_entry, "dest")
         if source_hash != dest_hash:
             return (True, SyncReason.CONTENT_CHANGED)
 
@@ -92,39 +230,82 @@ def should_sync_file(source: Path, dest: Path) -> Tuple[bool, Optional[SyncReaso
     return (False, None)
 
 
+def _walk_markdown_files(root: Path) -> Iterator[Path]:
+    """
+    Walk a directory tree with os.scandir(), yielding markdown files.
+
+    DirEntry type checks reuse the data returned while listing the
+    directory, so most entries cost no extra stat call. Symlinks are
+    neither followed nor yielded, and unreadable directories are skipped.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".md") and not entry.is_symlink():
+                        yield Path(entry.path)
+        except OSError:
+            continue
+
+
 def find_markdown_files(source_dir: Path) -> List[Path]:
     """
     Recursively find all markdown files in a directory.
 
-    Returns list of absolute paths to .md files.
+    Returns list of absolute paths to .md files, excluding symlinks,
+    in no particular order.
     """
-    return sorted(source_dir.rglob("*.md"))
+    return list(_walk_markdown_files(source_dir))
 
 
 def build_sync_plan(
     source_dir: Path,
-    dest_dir: Path
+    dest_dir: Path,
+    manifest: Optional[Manifest] = None
 ) -> Tuple[List[SyncCandidate], List[Path]]:
     """
     Build list of files that need syncing.
 
+    If a manifest is given, it is used as a hash cache and updated in place:
+    new hashes are recorded and entries for vanished files are dropped.
+
     Returns:
         Tuple of (candidates_to_sync, skipped_files)
     """
     candidates = []
     skipped = []
+    files = []
 
     for source_path in find_markdown_files(source_dir):
-        # Skip symlinks
-        if source_path.is_symlink():
-            continue
-
         # Compute relative path and destination
         relative_path = source_path.relative_to(source_dir)
         dest_path = dest_dir / relative_path
-
-        should_sync, reason = should_sync_file(source_path, dest_path)
-
+        files.append((source_path, dest_path, relative_path))
+
+    # Give each file its own cache entry so worker threads never share one
+    cache_entries = [None] * len(files)
+    if manifest is not None:
+        current = {relative_path.as_posix() for _, _, relative_path in files}
+        for stale_key in manifest.keys() - current:
+            del manifest[stale_key]
+        cache_entries = [
+            manifest.setdefault(relative_path.as_posix(), {})
+            for _, _, relative_path in files
+        ]
+
+    # Change detection is I/O bound (stat and hashing release the GIL),
+    # so check files concurrently and collect results in order
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        decisions = list(executor.map(
+            lambda args: should_sync_file(args[0][0], args[0][1], args[1]),
+            zip(files, cache_entries)
+        ))
+
+    for (source_path, dest_path, relative_path), (should_sync, reason) in zip(files, decisions):
         if should_sync and reason is not None:
             candidates.append(SyncCandidate(
                 source_path=source_path,
@@ -135,9 +316,79 @@ def build_sync_plan(
         else:
             skipped.append(relative_path)
 
+    # Traversal order is arbitrary, so sort for stable display
+    candidates.sort(key=lambda candidate: candidate.relative_path)
+    skipped.sort()
     return candidates, skipped
 
 
+def _kernel_copy_chunk(method: str, infd: int, outfd: int, offset: int) -> int:
+    """Copy one block at offset with the named syscall, returning bytes copied."""
+    if method == "copy_file_range":
+        # A reflink on copy-on-write filesystems
+        return os.copy_file_range(infd, outfd, COPY_BLOCK_SIZE, offset, offset)
+    return os.sendfile(outfd, infd, offset, COPY_BLOCK_SIZE)
+
+
+def _kernel_copy(source: Path, dest: Path) -> bool:
+    """
+    Copy file contents without passing data through user space.
+
+    Returns False if no kernel copy method works for these files, in which
+    case dest may have been truncated but nothing has been written to it.
+    Raises OSError if the copy stops short of the source size.
+    """
+    with open(source, 'rb') as fsrc, open(dest, 'wb') as fdst:
+        infd, outfd = fsrc.fileno(), fdst.fileno()
+        size = os.fstat(infd).st_size
+        for method in _KERNEL_COPY_METHODS:
+            offset = 0
+            try:
+                while copied := _kernel_copy_chunk(method, infd, outfd, offset):
+                    offset += copied
+            except OSError as e:
+                # Only fall back if the method was rejected outright
+                if offset or e.errno not in _COPY_FALLBACK_ERRNOS:
+                    raise
+                continue
+            # Some filesystems report EOF straight away instead of failing
+            if offset == 0 and size > 0:
+                continue
+            if offset != size:
+                raise OSError(errno.EIO, f"Copied {offset} of {size} bytes", str(source))
+            return True
+    return False
+
+
+def _fast_copy(source: Path, dest: Path) -> None:
+    """
+    Copy a file with its metadata, like shutil.copy2().
+
+    Tries os.copy_file_range(), then os.sendfile(), then shutil.copyfile().
+    Raises shutil.SameFileError if source and dest are the same file.
+    """
+    # Opening dest for writing would truncate the source
+    try:
+        same_file = os.path.samefile(source, dest)
+    except OSError:
+        same_file = False
+    if same_file:
+        raise shutil.SameFileError(f"{source!r} and {dest!r} are the same file")
+
+    if not _kernel_copy(source, dest):
+        shutil.copyfile(source, dest)
+    shutil.copystat(source, dest)
+
+
+def _copy_one(candidate: SyncCandidate) -> Tuple[SyncCandidate, Optional[str]]:
+    """Copy a single candidate, returning an error message instead of raising."""
+    try:
+        _fast_copy(candidate.source_path, candidate.dest_path)
+        return (candidate, None)
+    except Exception as e:
+        return (candidate, str(e) or type(e).__name__)
+
+
 def execute_sync(
     candidates: List[SyncCandidate],
     dry_run: bool = False
@@ -146,27 +397,35 @@ def execute_sync(
     Execute the sync operation.
 
     Creates destination directories as needed and copies files.
-    Uses shutil.copy2() to preserve file metadata.
+    Copies in kernel space where possible and preserves file metadata
+    like shutil.copy2(). Copies run concurrently in a thread pool.
     """
+    if dry_run:
+        return SyncResult(synced_files=list(candidates), skipped_files=[], errors=[])
+
+    # Create destination directories serially so copy threads never race on mkdir
+    dir_errors = {}
+    for directory in sorted({candidate.dest_path.parent for candidate in candidates}):
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+        except Exception as e:
+            dir_errors[directory] = str(e) or type(e).__name__
+
+    copyable = [c for c in candidates if c.dest_path.parent not in dir_errors]
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        copy_errors = dict(executor.map(_copy_one, copyable))
+
     synced = []
     errors = []
 
     for candidate in candidates:
-        if dry_run:
-            synced.append(candidate)
-            continue
-
-        try:
-            # Create destination directory if needed
-            candidate.dest_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Copy file with metadata
-            shutil.copy2(candidate.source_path, candidate.dest_path)
+        if candidate.dest_path.parent in dir_errors:
+            errors.append((candidate.source_path, dir_errors[candidate.dest_path.parent]))
+        elif copy_errors[candidate] is not None:
+            errors.append((candidate.source_path, copy_errors[candidate]))
+        else:
             synced.append(candidate)
 
-        except Exception as e:
-            errors.append((candidate.source_path, str(e)))
-
     return SyncResult(
         synced_files=synced,
         skipped_files=[],  # Already tracked in build_sync_plan
@@ -174,6 +433,30 @@ def execute_sync(
     )
 
 
+def update_manifest_after_sync(manifest: Manifest, synced: List[SyncCandidate]) -> None:
+    """
+    Refresh manifest entries for files that were just copied.
+
+    The copied destination has the same content as the source, so a known
+    source hash is recorded for it; otherwise the stale destination hash
+    is dropped.
+    """
+    for candidate in synced:
+        entry = manifest.setdefault(candidate.relative_path.as_posix(), {})
+        cached_source = entry.get("source")
+        try:
+            source_key = _stat_key(candidate.source_path.stat())
+            dest_key = _stat_key(candidate.dest_path.stat())
+        except OSError:
+            manifest.pop(candidate.relative_path.as_posix(), None)
+            continue
+
+        if cached_source and cached_source[:-1] == source_key:
+            entry["dest"] = dest_key + [cached_source[-1]]
+        else:
+            entry.pop("dest", None)
+
+
 def reason_to_string(reason: SyncReason) -> str:
     """Convert SyncReason to human-readable string."""
     return {
@@ -235,6 +518,14 @@ def display_sync_summary(
             console.print(f"  [red]{path}:[/red] {error}")
 
 
+def write_manifest(dest_dir: Path, manifest: Manifest) -> None:
+    """Save the manifest, warning instead of failing if it can't be written."""
+    try:
+        save_manifest(dest_dir, manifest)
+    except OSError as e:
+        error_console.print(f"[yellow]Warning: could not write sync manifest:[/yellow] {e}")
+
+
 @click.command()
 @click.argument('source_dir', type=click.Path(exists=True, file_okay=False, dir_okay=True))
 @click.argument('dest_dir', type=click.Path(file_okay=False, dir_okay=True))
@@ -262,6 +553,7 @@ def sync_main(
       1. New files (don't exist in destination) are copied
       2. Files with newer mtime in source are copied
       3. If mtimes match, content hash is compared
+         (hashes are cached in DEST_DIR/.sync-manifest.json)
 
     \b
     NOTES:
@@ -286,9 +578,10 @@ def sync_main(
             console.print("[yellow]Dry run mode - no files will be copied[/yellow]")
         console.print()
 
-    # Build sync plan
+    # Build sync plan, reusing hashes cached by previous runs
+    manifest = load_manifest(dest_path)
     try:
-        candidates, skipped = build_sync_plan(source_path, dest_path)
+        candidates, skipped = build_sync_plan(source_path, dest_path, manifest)
     except Exception as e:
         error_console.print(f"[bold red]Error scanning files:[/bold red] {e}")
         sys.exit(1)
@@ -301,12 +594,18 @@ def sync_main(
 
     # Execute sync
     if not candidates:
+        if not dry_run:
+            write_manifest(dest_path, manifest)
         if not quiet:
             console.print("[green]All files are up to date.[/green]")
         return
 
     result = execute_sync(candidates, dry_run)
 
+    if not dry_run:
+        update_manifest_after_sync(manifest, result.synced_files)
+        write_manifest(dest_path, manifest)
+
     # Display summary
     if not quiet:
         display_sync_summary(result, len(skipped), dry_run)